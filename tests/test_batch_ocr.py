@@ -0,0 +1,66 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for multi-page batch OCR page splitting."""
+
+from PIL import Image
+
+from extract_links import extract_text_batch
+
+
+def _make_images(tmp_path, count):
+    """Create tiny throwaway PNGs so preprocessing has real files to open."""
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"img{i}.png"
+        Image.new("L", (1200, 10), color=255).save(path)
+        paths.append(path)
+    return paths
+
+
+class TestExtractTextBatch:
+    """Test form-feed splitting of the single tesseract invocation output."""
+
+    def test_empty_batch(self):
+        assert extract_text_batch([]) == []
+
+    def test_exact_page_split(self, tmp_path, monkeypatch):
+        paths = _make_images(tmp_path, 3)
+        monkeypatch.setattr(
+            "extract_links.pytesseract.image_to_string",
+            lambda *args, **kwargs: "page one\fpage two\fpage three",
+        )
+        assert extract_text_batch(paths) == ["page one", "page two", "page three"]
+
+    def test_trailing_form_feed_is_dropped(self, tmp_path, monkeypatch):
+        """Tesseract emits a form feed after the last page as well."""
+        paths = _make_images(tmp_path, 2)
+        monkeypatch.setattr(
+            "extract_links.pytesseract.image_to_string",
+            lambda *args, **kwargs: "page one\fpage two\f",
+        )
+        assert extract_text_batch(paths) == ["page one", "page two"]
+
+    def test_page_count_mismatch_falls_back_to_per_image(self, tmp_path, monkeypatch):
+        paths = _make_images(tmp_path, 2)
+        monkeypatch.setattr(
+            "extract_links.pytesseract.image_to_string",
+            lambda *args, **kwargs: "only one page",
+        )
+        monkeypatch.setattr(
+            "extract_links.extract_text",
+            lambda path: f"text for {path.name}",
+        )
+        assert extract_text_batch(paths) == ["text for img0.png", "text for img1.png"]
@@ -91,6 +91,14 @@ class TestFixOCRArtifacts:
         url = "ftp://files.example.com/data"
         assert _fix_ocr_artifacts(url) == url
 
+    def test_ftp_hex_path_passes_through(self):
+        url = "ftp://files.example.com/Qaeba2f424949c54"
+        assert _fix_ocr_artifacts(url) == url
+
+    def test_www_hex_path_passes_through(self):
+        url = "www.example.com/Qaeba2f424949c54"
+        assert _fix_ocr_artifacts(url) == url
+
     def test_empty_path(self):
         url = "https://example.com"
         assert _fix_ocr_artifacts(url) == url
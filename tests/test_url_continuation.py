@@ -47,6 +47,9 @@ class TestLooksLikeURLContinuation:
             "",
             "    ",
             "hi",  # too short (< 5 chars)
+            "———————",  # em-dash rule (common OCR noise)
+            "→→→→→→",  # arrow run
+            "……………",  # ellipsis run
         ],
     )
     def test_rejects_non_url_lines(self, line):
@@ -81,6 +84,12 @@ class TestRejoinWrappedURLs:
         lines = result.split("\n")
         assert len(lines) == 2
 
+    def test_does_not_join_symbol_noise(self):
+        text = "Visit https://example.com/docs\n———————\nmore prose"
+        result = rejoin_wrapped_urls(text)
+        lines = result.split("\n")
+        assert len(lines) == 3
+
     def test_no_urls_passes_through(self):
         text = "Just some text\nwith multiple lines\nand no URLs."
         assert rejoin_wrapped_urls(text) == text
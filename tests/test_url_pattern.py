@@ -61,6 +61,8 @@ class TestURLPattern:
             "example.com/path",  # bare domain, no scheme
             "just some text with numbers 12345",
             "",
+            "http://",  # bare scheme with no body
+            "see https:// and more",  # truncated scheme mid-sentence
         ],
     )
     def test_no_match_on_non_urls(self, text):